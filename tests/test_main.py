@@ -0,0 +1,154 @@
+import io
+import unittest
+
+from bdb_parser.main import (
+    EXAMPLE_DUMP,
+    analyze_dump,
+    get_chunks,
+    iter_data_lines,
+    parse_asn1_data,
+    parse_key_value,
+    parse_pool_value,
+)
+
+PRIVATE_KEY = "7d13492d7b76c967c03d86faa5e982676c6705593a806fb832504aa4e45b87e9"
+PUBLIC_KEY = "0210933eeae2f5cc26a7938ff2e1a9502b41addba6c7f41cfedca0f8a77dcd0a3e"
+PUBLIC_KEY_2 = "022094799b330f1f0da42d71b03348fd17a6ea703dc09c2f4833944fd70c9aba1d"
+KEYMETA_LINE = "076b65796d65746121" + PUBLIC_KEY
+
+
+class TestPrivateKeyParsing(unittest.TestCase):
+    def test_short_key_value_is_rejected(self):
+        self.assertIsNone(parse_key_value(["25"], 0)["value"])
+
+    def test_short_asn1_data_is_rejected(self):
+        self.assertIsNone(parse_asn1_data("0a6d696e76657273696f6e"))
+
+    def test_key_value(self):
+        value = parse_key_value([PRIVATE_KEY + "00" * 32], 0)["value"]
+        self.assertEqual(value, PRIVATE_KEY)
+
+
+class TestAsn1Parsing(unittest.TestCase):
+    def test_der_public_key(self):
+        # SubjectPublicKeyInfo for a compressed secp256k1 key
+        der = "3036301006072a8648ce3d020106052b8104000a032200" + PUBLIC_KEY
+        self.assertEqual(
+            parse_asn1_data(der),
+            {"type": "ECPublicKey", "public_key": PUBLIC_KEY},
+        )
+
+    def test_raw_private_key_starting_with_sequence_tag(self):
+        private_key = "30" + "11" * 31
+        self.assertEqual(
+            parse_asn1_data(private_key),
+            {"type": "ECPrivateKey", "private_key": private_key, "public_key": None},
+        )
+
+
+class TestPoolParsing(unittest.TestCase):
+    def test_timestamp(self):
+        value = parse_pool_value(["b28d5b00bee44667", KEYMETA_LINE], 0)["value"]
+        self.assertEqual(value[0]["timestamp"], 0xB28D5B00BEE44667)
+
+    def test_malformed_timestamp_is_rejected(self):
+        self.assertEqual(parse_pool_value(["-b28d5", KEYMETA_LINE], 0)["value"], [])
+
+    def test_pool_record_with_keymeta_lines(self):
+        keymeta_line_2 = "076b65796d65746121" + PUBLIC_KEY_2
+        entries = analyze_dump(
+            [
+                "04706f6f6c0100000000000000",
+                "b28d5b00bee44667",
+                KEYMETA_LINE,
+                "0a000000bee44667",
+                keymeta_line_2.upper(),
+                "0a000000bee44667",
+                "07707572706f7365",
+            ]
+        )
+        pool = next(entries)
+        self.assertEqual(pool.key_ascii, "pool")
+        self.assertEqual(
+            pool.parsed_value,
+            [
+                {
+                    "name": "keymeta",
+                    "timestamp": 0xB28D5B00BEE44667,
+                    "public_key": "21" + PUBLIC_KEY,
+                },
+                {
+                    "name": "keymeta",
+                    "timestamp": 0x0A000000BEE44667,
+                    "public_key": ("21" + PUBLIC_KEY_2).upper(),
+                },
+            ],
+        )
+
+    def test_non_keymeta_line_ends_pool_value(self):
+        value = parse_pool_value(["b28d5b00bee44667", "07707572706f7365"], 0)["value"]
+        self.assertEqual(value, [])
+
+
+class TestAnalyzeDump(unittest.TestCase):
+    def setUp(self):
+        self.entries = list(analyze_dump(iter_data_lines(io.StringIO(EXAMPLE_DUMP))))
+
+    def find(self, name):
+        return [entry for entry in self.entries if entry.key_ascii == name]
+
+    def test_key_entries(self):
+        self.assertEqual(
+            [(entry.key, entry.parsed_value) for entry in self.find("key")],
+            [
+                (
+                    PUBLIC_KEY,
+                    "d63081d302010104207d13492d7b76c967c03d86faa5e982676c6705593a806f",
+                ),
+                (
+                    PUBLIC_KEY_2,
+                    "d63081d30201010420f05b74def5f5e1026b48171ff92b0372e939499bc960f4",
+                ),
+            ],
+        )
+
+    def test_pool_entry(self):
+        (pool,) = self.find("pool")
+        self.assertEqual(pool.key, 1)
+        self.assertEqual(
+            pool.parsed_value,
+            [
+                {
+                    "name": "keymeta",
+                    "timestamp": 12866039769228133991,
+                    "public_key": "21" + PUBLIC_KEY,
+                },
+                {
+                    "name": "keymeta",
+                    "timestamp": 720575943581910631,
+                    "public_key": "21" + PUBLIC_KEY_2,
+                },
+            ],
+        )
+
+    def test_minversion_entry(self):
+        (minversion,) = self.find("minversion")
+        self.assertEqual(minversion.key, "")
+        self.assertEqual(minversion.parsed_value, 0x60EA0000)
+
+    def test_accepts_text(self):
+        entries = analyze_dump(get_chunks(EXAMPLE_DUMP)["data"])
+        self.assertEqual(list(entries), self.entries)
+
+
+class TestGetChunks(unittest.TestCase):
+    def test_header_and_data(self):
+        chunks = get_chunks("VERSION=3\nHEADER=END\n  036b6579\n\n  00\nDATA=END\n")
+        self.assertEqual(
+            chunks,
+            {"VERSION": "3", "HEADER": "END", "DATA": "END", "data": "036b6579\n00"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()